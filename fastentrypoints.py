@@ -0,0 +1,40 @@
+"""
+Fast entry point launchers for Safety Stock Analyzer, imported by setup.py.
+The launchers setuptools writes for `setup.py install`/`develop` load pkg_resources,
+which scans every installed distribution before the GUI starts. Importing this module
+patches easy_install.ScriptWriter so each script is just an import and a call - the
+same launcher pip already generates when installing a wheel.
+"""
+
+import re
+
+SCRIPT_TEMPLATE = """# -*- coding: utf-8 -*-
+import re
+import sys
+
+from {module} import {import_name}
+
+if __name__ == '__main__':
+    sys.argv[0] = re.sub(r'(-script\\.pyw?|\\.exe)?$', '', sys.argv[0])
+    sys.exit({func}())
+"""
+
+
+def get_args(cls, dist, header=None):
+    """Yield the script arguments for every console and gui entry point of dist"""
+    if header is None:
+        header = cls.get_header()
+    for script_type in ('console', 'gui'):
+        for name, ep in dist.get_entry_map(f'{script_type}_scripts').items():
+            if re.search(r'[\\/]', name):
+                raise ValueError("Path separators not allowed in script names")
+            script_text = SCRIPT_TEMPLATE.format(
+                module=ep.module_name, import_name=ep.attrs[0], func='.'.join(ep.attrs))
+            yield from cls._get_script_args(script_type, name, header, script_text)
+
+
+try:
+    from setuptools.command import easy_install
+    easy_install.ScriptWriter.get_args = classmethod(get_args)
+except (ImportError, AttributeError):
+    pass  # setuptools without easy_install only installs wheels, which already use direct launchers
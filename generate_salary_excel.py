@@ -1,250 +1,239 @@
-import math
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
-
-
-def create_salary_workbook() -> Workbook:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Salaire Maroc"
-
-    header_fill = PatternFill(start_color="FFEDEDED", end_color="FFEDEDED", fill_type="solid")
-    bold = Font(bold=True)
-    thin = Side(border_style="thin", color="FFCCCCCC")
-    border = Border(left=thin, right=thin, top=thin, bottom=thin)
-
-    # Column widths
-    widths = {
-        1: 30, 2: 20, 3: 20
-    }
-    for col, width in widths.items():
-        ws.column_dimensions[get_column_letter(col)].width = width
-
-    row = 1
-    ws.cell(row=row, column=1, value="Paramètres").font = Font(bold=True, size=13)
-    row += 1
-
-    # Inputs
+from zipfile import ZipFile, ZIP_DEFLATED
+
+# The workbook has a fixed shape (one small sheet, six cell formats), so the
+# package parts are written directly instead of going through openpyxl.
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Salaire Maroc" sheetId="1" r:id="rId1"/></sheets>'
+    '<calcPr calcId="124519" fullCalcOnLoad="1"/>'
+    '</workbook>'
+)
+
+WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# Cell formats, referenced from sheet cells by their index in cellXfs
+DEFAULT, BORDERED, BORDERED_BOLD, HEADER, TITLE, TITLE_FILL = range(6)
+
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="3">'
+    '<font><sz val="11"/><color theme="1"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    '<font><b val="1"/></font>'
+    '<font><b val="1"/><sz val="13"/></font>'
+    '</fonts>'
+    '<fills count="3">'
+    '<fill><patternFill/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFEDEDED"/><bgColor rgb="FFEDEDED"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="2">'
+    '<border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border>'
+    '<left style="thin"><color rgb="FFCCCCCC"/></left>'
+    '<right style="thin"><color rgb="FFCCCCCC"/></right>'
+    '<top style="thin"><color rgb="FFCCCCCC"/></top>'
+    '<bottom style="thin"><color rgb="FFCCCCCC"/></bottom>'
+    '<diagonal/>'
+    '</border>'
+    '</borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="6">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="1" xfId="0" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="1" xfId="0" applyFont="1" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="center"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="2" borderId="0" xfId="0" applyFill="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+# Column widths 30/20/20, panes frozen below the header row (A3)
+SHEET_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="2" topLeftCell="A3" activePane="bottomLeft" state="frozen"/>'
+    '<selection pane="bottomLeft" activeCell="A3" sqref="A3"/>'
+    '</sheetView></sheetViews>'
+    '<sheetFormatPr defaultRowHeight="15"/>'
+    '<cols>'
+    '<col min="1" max="1" width="30" customWidth="1"/>'
+    '<col min="2" max="2" width="20" customWidth="1"/>'
+    '<col min="3" max="3" width="20" customWidth="1"/>'
+    '</cols>'
+    '<sheetData>{rows}</sheetData>'
+    '<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>'
+    '</worksheet>'
+)
+
+
+# Absolute references into the value column, indexed by row number
+_B = [f"$B${i}" for i in range(256)]
+
+# Text escaping for cell content. xml.sax.saxutils.escape would do the same
+# but importing it pulls in urllib.request and http.client at startup.
+_XML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _escape(text: str) -> str:
+    return text.translate(_XML_ESCAPES)
+
+
+def _cell(ref: str, value, style: int, formula: bool = False) -> str:
+    """Render one <c> element: empty, formula, inline text or number."""
+    if value is None:
+        return f'<c r="{ref}" s="{style}"/>'
+    if formula:
+        return f'<c r="{ref}" s="{style}"><f>{_escape(value[1:])}</f></c>'
+    if isinstance(value, str):
+        return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t>{_escape(value)}</t></is></c>'
+    return f'<c r="{ref}" s="{style}"><v>{value}</v></c>'
+
+
+def create_salary_workbook(output_path: str) -> None:
+    sheet_rows = []
+
+    def append(cells: list) -> None:
+        r = len(sheet_rows) + 1
+        sheet_rows.append(
+            f'<row r="{r}">'
+            + "".join(_cell(f"{col}{r}", *cell) for col, cell in zip("ABC", cells))
+            + "</row>"
+        )
+
+    def emit(label, value, note, style: int = BORDERED) -> None:
+        # Only the value column holds formulas; notes such as "= base + HS125"
+        # are plain text even though they start with "="
+        formula = isinstance(value, str) and value.startswith("=")
+        append([(label, style), (value, style, formula), (note, BORDERED)])
+
+    def title(text: str) -> None:
+        append([(text, TITLE), (None, TITLE_FILL), (None, TITLE_FILL)])
+
+    title("Paramètres")
+
+    # Inputs (key, label, default)
     inputs = [
-        ("Jours travaillés (mois)", 26),
-        ("Salaire journalier de base", 0),
-        ("Heures supp 125% (nombre d'heures)", 0),
-        ("Heures supp 150% (nombre d'heures)", 0),
-        ("Taux horaire normal (MAD/heure)", 0),
-        ("Cotisation retraite complémentaire (CIMR) %", 0.0),
-        ("Personnes à charge (réduction IR)", 0),
+        ("jours", "Jours travaillés (mois)", 26),
+        ("sj", "Salaire journalier de base", 0),
+        ("hs125", "Heures supp 125% (nombre d'heures)", 0),
+        ("hs150", "Heures supp 150% (nombre d'heures)", 0),
+        ("taux_h", "Taux horaire normal (MAD/heure)", 0),
+        ("cimr", "Cotisation retraite complémentaire (CIMR) %", 0.0),
+        ("charges", "Personnes à charge (réduction IR)", 0),
     ]
 
-    ws.append(["Libellé", "Valeur", "Note"])
-    for col in range(1, 4):
-        c = ws.cell(row=row, column=col)
-        c.font = bold
-        c.fill = header_fill
-        c.border = border
-        c.alignment = Alignment(horizontal="center")
-    row += 1
-
-    start_input_row = row
-    for label, default in inputs:
-        ws.cell(row=row, column=1, value=label).border = border
-        ws.cell(row=row, column=2, value=default).border = border
-        ws.cell(row=row, column=3, value="Entrée utilisateur").border = border
-        row += 1
-
-    # Derived calculations and breakdown
-    row += 1
-    ws.cell(row=row, column=1, value="Calculs").font = Font(bold=True, size=13)
-    row += 1
-
-    calc_start = row
-
-    # Names for input cells for clarity
-    # Map input indexes
-    jours_cell = f"$B${start_input_row}"
-    sj_cell = f"$B${start_input_row + 1}"
-    hs125_cell = f"$B${start_input_row + 2}"
-    hs150_cell = f"$B${start_input_row + 3}"
-    taux_h_cell = f"$B${start_input_row + 4}"
-    cimr_cell = f"$B${start_input_row + 5}"
-    charges_cell = f"$B${start_input_row + 6}"
-
-    # Brut components
-    ws.append(["Salaire de base mensuel", None, "= Salaire journalier × Jours"])
-    ws.cell(row=row, column=2).value = f"={sj_cell}*{jours_cell}"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["Heures supp 125% (montant)", None, "= heures × taux × 125%"])
-    ws.cell(row=row, column=2).value = f"={hs125_cell}*{taux_h_cell}*1.25"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["Heures supp 150% (montant)", None, "= heures × taux × 150%"])
-    ws.cell(row=row, column=2).value = f"={hs150_cell}*{taux_h_cell}*1.5"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["Salaire brut mensuel", None, "= base + HS125 + HS150"])
-    base_cell = f"$B${calc_start}"
-    hs125_amt_cell = f"$B${calc_start + 1}"
-    hs150_amt_cell = f"$B${calc_start + 2}"
-    brut_cell = f"$B${row}"
-    ws.cell(row=row, column=2).value = f"={base_cell}+{hs125_amt_cell}+{hs150_amt_cell}"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    # Social contributions (employee share)
-    ws.append(["CNSS (4,48% plaf. 6 000)", None, "min(6 000 ; Brut) × 4,48%"])
-    cnss_row = row
-    ws.cell(row=row, column=2).value = f"=MIN(6000,{brut_cell})*0.0448"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["AMO (2,26% du Brut)", None, "Brut × 2,26%"])
-    amo_row = row
-    ws.cell(row=row, column=2).value = f"={brut_cell}*0.0226"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["CIMR (si applicable)", None, "Brut × % CIMR"])
-    cimr_row = row
-    ws.cell(row=row, column=2).value = f"={brut_cell}*({cimr_cell}/100)"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["Cotisations sociales (total)", None, "CNSS + AMO + CIMR"])
-    cotis_row = row
-    ws.cell(row=row, column=2).value = f"=$B${cnss_row}+$B${amo_row}+$B${cimr_row}"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    # Abattement frais pro (sur Brut - Cotisations)
-    ws.append(["Abattement frais professionnels (20% plaf. 2 500)", None, "min(20%×(Brut − Cotisations) ; 2500)"])
-    abatt_row = row
-    ws.cell(row=row, column=2).value = f"=MIN(({brut_cell}-$B${cotis_row})*0.2,2500)"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    # Net imposable
-    ws.append(["Salaire net imposable (SNI)", None, "Brut − Cotisations − Abattement"])
-    sni_row = row
-    sni_cell = f"$B${sni_row}"
-    ws.cell(row=row, column=2).value = f"={brut_cell}-$B${cotis_row}-$B${abatt_row}"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    # IR calculation by monthly brackets
-    # Brackets (monthly):
-    # 0 – 2,500: 0%
-    # 2,501 – 4,166: 10%
-    # 4,167 – 5,000: 20%
-    # 5,001 – 6,666: 30%
-    # 6,667 – 15,000: 34%
-    # > 15,000: 38%
-
-    # Helper: tax per bracket via Excel formula using MAX/MIN
+    # Calculation rows in sheet order. The layout is fixed, so every row
+    # number is known before anything is written: inputs start below the
+    # header, calculations below the blank spacer and the "Calculs" title.
+    calc_keys = (
+        "base", "hs125_amt", "hs150_amt", "brut",
+        "cnss", "amo", "cimr_amt", "cotis", "abatt", "sni",
+        "ir_brut", "reduc", "ir_net", "net",
+    )
+    start_input_row = 3
+    calc_start = start_input_row + len(inputs) + 2
+
+    # Cell references for every input and calculation, formatted once
+    C = {key: _B[start_input_row + i] for i, (key, _, _) in enumerate(inputs)}
+    C.update({key: _B[calc_start + i] for i, key in enumerate(calc_keys)})
+
+    # IR calculation by monthly brackets: (lower, upper, rate)
+    brackets = (
+        (0, 2500, 0.0),
+        (2500, 4166, 0.10),
+        (4166, 5000, 0.20),
+        (5000, 6666, 0.30),
+        (6666, 15000, 0.34),
+        (15000, None, 0.38),
+    )
+
+    # Helper: tax per bracket via Excel expression using MAX/MIN
     def tranche(lower: int, upper: int | None, rate: float) -> str:
         if upper is None:
-            return f"=MAX(0,{sni_cell}-{lower})*{rate}"
-        return f"=MAX(0,MIN({sni_cell},{upper})-{lower})*{rate}"
-
-    ws.append(["IR tranche 0%", None, "jusqu'à 2 500"])
-    ws.cell(row=row, column=2).value = tranche(0, 2500, 0.0)
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["IR tranche 10%", None, "2 501 à 4 166"])
-    ws.cell(row=row, column=2).value = tranche(2500, 4166, 0.10)
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["IR tranche 20%", None, "4 167 à 5 000"])
-    ws.cell(row=row, column=2).value = tranche(4166, 5000, 0.20)
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["IR tranche 30%", None, "5 001 à 6 666"])
-    ws.cell(row=row, column=2).value = tranche(5000, 6666, 0.30)
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["IR tranche 34%", None, "6 667 à 15 000"])
-    ws.cell(row=row, column=2).value = tranche(6666, 15000, 0.34)
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["IR tranche 38%", None, "> 15 000"])
-    ws.cell(row=row, column=2).value = tranche(15000, None, 0.38)
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    first_ir_row = sni_row + 1
-    last_ir_row = row - 1
-
-    ws.append(["IR brut (somme des tranches)", None, "Somme IR tranches"])
-    ir_brut_row = row
-    ir_brut_cell = f"$B${ir_brut_row}"
-    ws.cell(row=row, column=2).value = f"=SUM($B${first_ir_row}:$B${last_ir_row})"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    # Réduction charges de famille: 30 MAD par personne, max 180
-    ws.append(["Réduction IR (charges de famille)", None, "30 MAD × nb, max 180"])
-    reduc_row = row
-    ws.cell(row=row, column=2).value = f"=MIN({charges_cell}*30,180)"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    ws.append(["IR net", None, "max(IR brut − réduction, 0)"])
-    ir_net_row = row
-    ir_net_cell = f"$B${ir_net_row}"
-    ws.cell(row=row, column=2).value = f"=MAX({ir_brut_cell}-$B${reduc_row},0)"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    row += 1
-
-    # Salaire net à payer
-    ws.append(["Salaire net à payer", None, "Brut − Cotisations − IR net"])
-    ws.cell(row=row, column=2).value = f"={brut_cell}-$B${cotis_row}-{ir_net_cell}"
-    for col in range(1, 4):
-        ws.cell(row=row, column=col).border = border
-    ws.cell(row=row, column=1).font = Font(bold=True)
-    ws.cell(row=row, column=2).font = Font(bold=True)
-
-    # Styling headings
-    for r in [1, calc_start - 1]:
-        for c in range(1, 4):
-            ws.cell(row=r, column=c).fill = header_fill
-
-    # Freeze panes below header row
-    ws.freeze_panes = ws["A3"]
-
-    return wb
+            return f"MAX(0,{C['sni']}-{lower})*{rate}"
+        return f"MAX(0,MIN({C['sni']},{upper})-{lower})*{rate}"
+
+    # All taxed brackets summed in one cell instead of one row per bracket
+    ir_brut_formula = "=" + "+".join(tranche(*bracket) for bracket in brackets if bracket[2])
+
+    # (label, formula, note) for each calculation row, in calc_keys order
+    rows = (
+        # Brut components
+        ("Salaire de base mensuel", f"={C['sj']}*{C['jours']}", "= Salaire journalier × Jours"),
+        ("Heures supp 125% (montant)", f"={C['hs125']}*{C['taux_h']}*1.25", "= heures × taux × 125%"),
+        ("Heures supp 150% (montant)", f"={C['hs150']}*{C['taux_h']}*1.5", "= heures × taux × 150%"),
+        ("Salaire brut mensuel", f"={C['base']}+{C['hs125_amt']}+{C['hs150_amt']}", "= base + HS125 + HS150"),
+        # Social contributions (employee share)
+        ("CNSS (4,48% plaf. 6 000)", f"=MIN(6000,{C['brut']})*0.0448", "min(6 000 ; Brut) × 4,48%"),
+        ("AMO (2,26% du Brut)", f"={C['brut']}*0.0226", "Brut × 2,26%"),
+        ("CIMR (si applicable)", f"={C['brut']}*({C['cimr']}/100)", "Brut × % CIMR"),
+        ("Cotisations sociales (total)", f"={C['cnss']}+{C['amo']}+{C['cimr_amt']}", "CNSS + AMO + CIMR"),
+        # Abattement frais pro (sur Brut - Cotisations)
+        ("Abattement frais professionnels (20% plaf. 2 500)", f"=MIN(({C['brut']}-{C['cotis']})*0.2,2500)", "min(20%×(Brut − Cotisations) ; 2500)"),
+        # Net imposable
+        ("Salaire net imposable (SNI)", f"={C['brut']}-{C['cotis']}-{C['abatt']}", "Brut − Cotisations − Abattement"),
+        ("IR brut (somme des tranches)", ir_brut_formula, "Barème mensuel 0 % à 38 %"),
+        # Réduction charges de famille: 30 MAD par personne, max 180
+        ("Réduction IR (charges de famille)", f"=MIN({C['charges']}*30,180)", "30 MAD × nb, max 180"),
+        ("IR net", f"=MAX({C['ir_brut']}-{C['reduc']},0)", "max(IR brut − réduction, 0)"),
+        # Salaire net à payer
+        ("Salaire net à payer", f"={C['brut']}-{C['cotis']}-{C['ir_net']}", "Brut − Cotisations − IR net"),
+    )
+
+    append([(v, HEADER) for v in ("Libellé", "Valeur", "Note")])
+    for _, label, default in inputs:
+        emit(label, default, "Entrée utilisateur")
+
+    # Derived calculations and breakdown
+    append([])
+    title("Calculs")
+    for label, formula, note in rows[:-1]:
+        emit(label, formula, note)
+    emit(*rows[-1], style=BORDERED_BOLD)
+
+    with ZipFile(output_path, "w", ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", ROOT_RELS_XML)
+        zf.writestr("xl/workbook.xml", WORKBOOK_XML)
+        zf.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS_XML)
+        zf.writestr("xl/styles.xml", STYLES_XML)
+        zf.writestr("xl/worksheets/sheet1.xml", SHEET_XML.format(rows="".join(sheet_rows)))
 
 
 def main() -> None:
-    wb = create_salary_workbook()
     output_path = "salary_calculator_maroc.xlsx"
-    wb.save(output_path)
+    create_salary_workbook(output_path)
     print(f"Generated {output_path}")
 
 
@@ -7,27 +7,507 @@ Built with PyQt6 for a modern, professional desktop experience.
 
 import sys
 import os
-import pandas as pd
+import importlib.util
+import logging
+from functools import lru_cache
 import numpy as np
 from datetime import datetime
 from pathlib import Path
 
 # PyQt6 imports
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QLabel, QPushButton, QTableWidget, 
-                             QTableWidgetItem, QTabWidget, QTextEdit, QFileDialog,
+                             QHBoxLayout, QLabel, QPushButton, QTableView, 
+                             QTabWidget, QTextEdit, QFileDialog,
                              QMessageBox, QProgressBar, QStatusBar, QMenuBar,
                              QMenu, QSplitter, QFrame, QGroupBox,
-                             QGridLayout, QHeaderView, QAbstractItemView, QComboBox)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QMimeData, QSize
+                             QGridLayout, QHeaderView, QAbstractItemView, QComboBox, QSizePolicy)
+from PyQt6.QtCore import (Qt, QThread, pyqtSignal, QTimer, QMimeData, QSize,
+                          QAbstractTableModel, QModelIndex, QCoreApplication)
 from PyQt6.QtGui import (QFont, QPixmap, QIcon, QDragEnterEvent, QDropEvent, 
-                         QPalette, QColor, QAction)
+                         QPalette, QColor, QBrush, QAction)
+
+logger = logging.getLogger(__name__)
+
+
+def _lazy_import(name):
+    """Return module name, executed on first attribute access instead of now"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# pandas is most of this module's import time; main() finishes loading it once the window is up
+pd = _lazy_import('pandas')
+
+# matplotlib is imported lazily in create_charts_canvas, the first time the Charts tab is shown
+
+# Safety stock parameters: Z = 1.65 is the 95% confidence level, lead time in days
+SERVICE_LEVEL_Z = 1.65
+LEAD_TIME_DAYS = 30
+_Z_SQRT_LEAD = SERVICE_LEVEL_Z * np.sqrt(LEAD_TIME_DAYS)
+
+# Criticality levels by daily usage: > 10 CRITICAL, > 5 HIGH, > 2 MEDIUM, else LOW
+CRITICALITY_THRESHOLDS = np.array([2.0, 5.0, 10.0])
+CRITICALITY_LABELS = np.array(['LOW', 'MEDIUM', 'HIGH', 'CRITICAL'], dtype=object)
+
+# Process analysis table layout
+PROCESS_COLUMNS = ['Process', 'Item Number', 'Part Name', 'Total Usage', 'Usage Count', 'Avg Usage per Request',
+                   'Current Stock', 'D_Mean_per_Day', 'D_Std_per_Day', 'Safety Stock', 'Reorder Point', 'Criticality']
+PROCESS_DECIMAL_COLS = ['Avg Usage per Request', 'D_Mean_per_Day', 'D_Std_per_Day', 'Safety Stock', 'Reorder Point']
+
+# Safety stock table layout
+SAFETY_COLUMNS = ['Item Number', 'Part Name', 'Description 2', 'Total Usage', 'Usage Count', 'D_Mean_per_Day',
+                  'D_Std_per_Day', 'Current Stock', 'Safety Stock', 'Reorder Point', 'Criticality']
+SAFETY_DECIMAL_COLS = ['D_Mean_per_Day', 'D_Std_per_Day', 'Safety Stock', 'Reorder Point']
+
+# Required process parts columns and the keywords used to find a substitute when one is missing
+PROCESS_COLUMN_KEYWORDS = {
+    'Process': ('process', 'operation'),
+    'Item Number': ('item', 'part', 'number'),
+    'Part Name': ('name', 'description'),
+}
+
+# Spare parts data columns used by the safety stock analysis (a column needs all of a role's keywords)
+ANALYSIS_COLUMN_KEYWORDS = {
+    'item': ('item', 'number'),
+    'qty': ('req', 'qty'),
+    'stock': ('hand',),
+    'part': ('part', 'name'),
+    'desc': ('description', '2'),
+}
+# Spare parts data columns shown in the summary (a column needs any of a role's keywords)
+SUMMARY_COLUMN_KEYWORDS = {
+    'date': ('date', 'time', 'requested', 'created'),
+    'quantity': ('quantity', 'qty', 'amount', 'requested'),
+    'item': ('item', 'part', 'number', 'code'),
+}
+
+# CSV files larger than this are read in row chunks to cap peak memory
+CHUNKED_READ_BYTES = 100 * 1024 * 1024
+CSV_CHUNK_ROWS = 200_000
+
+# Below this many rows NumPy beats numexpr's thread start-up cost
+NUMEXPR_MIN_ROWS = 10_000
+# The numba kernel pays a one-off compile (cached on disk afterwards), so it only runs on big inputs
+NUMBA_MIN_ROWS = 100_000
+
+# Rows the data preview reveals at a time as the user scrolls down (Qt fetchMore)
+PREVIEW_FETCH_ROWS = 500
+
+# Help > About text
+ABOUT_HTML = """
+<h3>Safety Stock Analyzer - Professional Edition</h3>
+<p>A powerful tool for analyzing spare parts usage and calculating safety stock levels.</p>
+<p><b>Features:</b></p>
+<ul>
+    <li>📁 Drag & Drop file loading</li>
+    <li>📊 Real-time data display</li>
+    <li>🔍 Advanced safety stock analysis</li>
+    <li>📈 Professional charts and visualizations</li>
+    <li>📤 Export results to Excel/CSV</li>
+</ul>
+<p><b>Version:</b> 1.0 Professional</p>
+<p><b>Built with:</b> Python + PyQt6</p>
+"""
+
+# Application icon, looked up next to this file rather than in the working directory
+ICON_PATH = Path(__file__).resolve().parent / "icon.ico"
+
+# Table background brushes per criticality level (built once; the view asks for a QBrush on every paint)
+CRITICALITY_COLORS = {
+    'CRITICAL': QBrush(QColor(255, 200, 200)),  # Light red
+    'HIGH': QBrush(QColor(255, 255, 200)),  # Light yellow
+    'MEDIUM': QBrush(QColor(200, 255, 200)),  # Light green
+    'LOW': QBrush(QColor(200, 200, 255)),  # Light blue
+    'NO DATA': QBrush(QColor(240, 240, 240)),  # Light gray
+}
+
+
+@lru_cache(maxsize=None)
+def _numba_metrics_loop():
+    """Compile the per-item safety stock metrics loop with numba on first use"""
+    import numba  # Optional: GIL-free multithreaded kernel for large inputs
+    from numba import prange
+    
+    @numba.njit(parallel=True, cache=True)
+    def metrics_loop(total_usage, daily_std, z_sqrt_lead, lead_time, period_days, thresholds,
+                     daily_usage, safety_stock, reorder_point, levels):
+        """Daily usage, safety stock, reorder point and criticality level per item, in one parallel pass"""
+        for i in prange(total_usage.shape[0]):
+            daily = total_usage[i] / period_days if total_usage[i] > 0 else 0.0
+            ss = daily_std[i] * z_sqrt_lead
+            daily_usage[i] = daily
+            safety_stock[i] = ss
+            reorder_point[i] = daily * lead_time + ss
+            level = 0
+            for t in thresholds:
+                if daily > t:
+                    level += 1
+            levels[i] = level
+    
+    return metrics_loop
+
+
+def safety_stock_metrics(total_usage, daily_std, Z=SERVICE_LEVEL_Z, lead_time=LEAD_TIME_DAYS, period_days=30):
+    """Compute safety stock metrics for arrays of per-item usage totals and deviations
+    
+    Returns (daily_usage, safety_stock, reorder_point, criticality) as NumPy arrays.
+    Z = 1.65 is the 95% confidence level; lead_time and period_days are in days.
+    """
+    if Z == SERVICE_LEVEL_Z and lead_time == LEAD_TIME_DAYS:
+        z_sqrt_lead = _Z_SQRT_LEAD
+    else:
+        z_sqrt_lead = Z * np.sqrt(lead_time)
+    n = len(total_usage)
+    if n >= NUMBA_MIN_ROWS and _has_module('numba'):
+        daily_usage, safety_stock, reorder_point = np.empty(n), np.empty(n), np.empty(n)
+        levels = np.empty(n, dtype=np.intp)
+        _numba_metrics_loop()(total_usage, daily_std, z_sqrt_lead, lead_time, period_days, CRITICALITY_THRESHOLDS,
+                              daily_usage, safety_stock, reorder_point, levels)
+        return daily_usage, safety_stock, reorder_point, CRITICALITY_LABELS.take(levels)
+    if n >= NUMEXPR_MIN_ROWS and _has_module('numexpr'):
+        import numexpr as ne  # Optional: fused, multithreaded evaluation for large inputs
+        daily_usage = ne.evaluate("where(total_usage > 0, total_usage / period_days, 0.0)")
+        safety_stock = ne.evaluate("daily_std * z_sqrt_lead")
+        reorder_point = ne.evaluate("daily_usage * lead_time + safety_stock")
+    else:
+        daily_usage = np.divide(total_usage, period_days, out=np.zeros_like(total_usage), where=total_usage > 0)
+        safety_stock = np.multiply(daily_std, z_sqrt_lead)
+        reorder_point = np.multiply(daily_usage, lead_time)
+        reorder_point += safety_stock
+    criticality = CRITICALITY_LABELS.take(np.searchsorted(CRITICALITY_THRESHOLDS, daily_usage))
+    return daily_usage, safety_stock, reorder_point, criticality
+
+
+@lru_cache(maxsize=None)
+def _has_module(name):
+    """Check whether an optional dependency is installed without importing it"""
+    return importlib.util.find_spec(name) is not None
+
+
+def _excel_engine():
+    """Rust-based calamine reader when installed, else the pandas default"""
+    return 'calamine' if _has_module('python_calamine') else None
+
+
+def _xlsx_writer_engine():
+    """XlsxWriter (streams XML, far lighter per cell) when installed, else openpyxl"""
+    return 'xlsxwriter' if _has_module('xlsxwriter') else 'openpyxl'
+
+
+def _csv_engine():
+    """Multithreaded pyarrow CSV parser when installed, else the pandas default"""
+    return 'pyarrow' if _has_module('pyarrow') else None
+
+
+def read_data_file(file_path):
+    """Read a spare parts export (.xlsx/.xls, .csv or tab-separated text) with the fastest available engine"""
+    lower = file_path.lower()
+    if lower.endswith(('.xlsx', '.xls')):
+        return pd.read_excel(file_path, engine=_excel_engine())
+    return pd.read_csv(file_path, sep=',' if lower.endswith('.csv') else '\t', engine=_csv_engine())
+
+
+def resolve_process_columns(columns):
+    """Map each required process parts column to the column it is taken from (None if not found)"""
+    lc = [(c, str(c).lower()) for c in columns]  # Lowercase once for all searches
+    mapping = {}
+    for target, keywords in PROCESS_COLUMN_KEYWORDS.items():
+        if target in columns:
+            mapping[target] = target
+        else:
+            matches = [c for c, low in lc if any(k in low for k in keywords)]
+            mapping[target] = matches[0] if matches else None
+    return mapping
+
+
+def detect_columns(columns, role_keywords, match=all):
+    """Map each role to the last column matching its keywords (None if not found)
+    
+    Each column is lowercased once and goes to the first role it matches, in dict order.
+    """
+    roles = dict.fromkeys(role_keywords)
+    for col in columns:
+        low = str(col).lower()
+        for role, keywords in role_keywords.items():
+            if match(k in low for k in keywords):
+                roles[role] = col
+                break
+    return roles
+
+
+def read_process_file(file_path):
+    """Read the columns a process parts file needs, with the fastest available pandas engine
+    
+    Uses calamine for Excel and pyarrow for CSV when installed, otherwise the pandas defaults.
+    Only the columns picked by resolve_process_columns are kept, and very large CSV files are
+    read in chunks so the full-width file is never held in memory at once.
+    """
+    is_excel = file_path.lower().endswith(('.xlsx', '.xls'))
+    if is_excel:
+        header = pd.read_excel(file_path, engine=_excel_engine(), nrows=0).columns
+    else:
+        header = pd.read_csv(file_path, nrows=0).columns
+    
+    usecols = list(dict.fromkeys(c for c in resolve_process_columns(header).values() if c is not None))
+    usecols = usecols or None  # Nothing matched: keep every column so the row count survives
+    
+    if is_excel:
+        return pd.read_excel(file_path, engine=_excel_engine(), usecols=usecols)
+    if os.path.getsize(file_path) > CHUNKED_READ_BYTES:
+        # Every kept column is cleaned as text; reading it as str stops each chunk inferring its own dtype
+        # (a chunk with a blank item number would otherwise turn 1000 into '1000.0' for that chunk only)
+        chunks = pd.read_csv(file_path, usecols=usecols, chunksize=CSV_CHUNK_ROWS, dtype=str)
+        return pd.concat(chunks, ignore_index=True)
+    return pd.read_csv(file_path, engine=_csv_engine(), usecols=usecols)
+
+
+def clean_process_parts(df):
+    """Clean and validate process parts data in place (the input frame is modified)"""
+    df_clean = df  # Callers rebind the result, so skip a full copy
+    
+    # Ensure required columns exist, borrowing similar columns or 'Unknown'
+    for col, source in resolve_process_columns(df_clean.columns).items():
+        if source is None:
+            df_clean[col] = 'Unknown'
+        elif source != col:
+            df_clean[col] = df_clean[source]
+    
+    # Clean data
+    df_clean['Process'] = df_clean['Process'].astype(str).str.strip()
+    df_clean['Item Number'] = df_clean['Item Number'].astype(str).str.strip()
+    df_clean['Part Name'] = df_clean['Part Name'].astype(str).str.strip()
+    
+    # Remove rows with missing critical data
+    df_clean = df_clean.dropna(subset=['Process', 'Item Number'])
+    
+    # Repeated keys as categoricals: smaller, and joins/nunique work on integer codes
+    df_clean['Process'] = df_clean['Process'].astype('category')
+    df_clean['Item Number'] = df_clean['Item Number'].astype('category')
+    
+    return df_clean
+
+
+def item_usage(data, item_col, qty_col, stock_col=None):
+    """Aggregate spare parts data per item number: total, count and deviation of qty_col, first stock_col"""
+    usage_aggs = {
+        'Total Usage': (qty_col, 'sum'),
+        'Usage Count': (qty_col, 'size'),
+        'D_Std_per_Day': (qty_col, 'std'),
+    }
+    if stock_col:
+        usage_aggs['Current Stock'] = (stock_col, 'first')
+    return data.groupby(item_col, sort=False).agg(**usage_aggs)
+
+
+def _compute_process_analysis(usage, process_parts):
+    """Join per-item usage aggregates onto process parts and add the safety stock metrics
+    
+    usage is indexed by item number with 'Total Usage', 'Usage Count', 'D_Std_per_Day'
+    and optionally 'Current Stock' columns, as built by item_usage.
+    """
+    parts = process_parts[['Process', 'Item Number', 'Part Name']]
+    if not isinstance(parts['Process'].dtype, pd.CategoricalDtype):
+        parts = parts.astype({'Process': 'category'})  # The final sort then runs on integer codes
+    if isinstance(parts['Item Number'].dtype, pd.CategoricalDtype):
+        # One category index shared by both sides, so the lookup compares integer codes
+        item_dtype = pd.CategoricalDtype(parts['Item Number'].cat.categories.union(usage.index, sort=False))
+        parts = parts.astype({'Item Number': item_dtype})
+        usage = usage.set_axis(usage.index.astype(item_dtype))
+    
+    # Row of each part in the usage table (-1 = no usage data), gathered straight into columns
+    pos = usage.index.get_indexer(parts['Item Number'])
+    no_data = pos < 0
+    
+    def lookup(col):
+        if col not in usage.columns or usage.empty:
+            return np.zeros(len(pos))
+        values = usage[col].to_numpy().take(pos, mode='clip')
+        return np.where(no_data | pd.isna(values), 0, values)
+    
+    total_usage = lookup('Total Usage')
+    usage_count = lookup('Usage Count').astype(int)
+    daily_std = lookup('D_Std_per_Day').astype(np.float64)
+    avg_usage = np.divide(total_usage, usage_count, out=np.zeros(len(pos)), where=usage_count > 0)
+    
+    # Daily usage, safety stock, reorder point and criticality in one pass
+    daily_usage, safety_stock, reorder_point, criticality = safety_stock_metrics(
+        total_usage.astype(np.float64), daily_std)
+    
+    analysis = pd.DataFrame({
+        'Process': parts['Process'].array,
+        'Item Number': parts['Item Number'].array,
+        'Part Name': parts['Part Name'].array,
+        'Total Usage': total_usage,
+        'Usage Count': usage_count,
+        'Avg Usage per Request': avg_usage,
+        'Current Stock': lookup('Current Stock'),
+        'D_Mean_per_Day': daily_usage,
+        'D_Std_per_Day': daily_std,
+        'Safety Stock': safety_stock,
+        'Reorder Point': reorder_point,
+        'Criticality': np.where(no_data, 'NO DATA', criticality),
+    }, columns=PROCESS_COLUMNS, copy=False)
+    
+    if not analysis.empty:
+        analysis = analysis.sort_values(['Process', 'Total Usage'], ascending=[True, False], ignore_index=True)
+    return analysis
+
+
+class MissingColumnError(ValueError):
+    """Raised when the spare parts data lacks a column an analysis needs"""
+
+
+class ProcessLoadWorker(QThread):
+    """Load, clean and analyze a process parts file off the GUI thread
+    
+    The spare parts data, its usage key and any cached usage aggregates are captured when the
+    worker is created on the GUI thread; run() reads only these, never the analyzer's state.
+    """
+    loaded = pyqtSignal(object)  # (process_parts, process_analysis or None, usage or None)
+    error = pyqtSignal(str)
+    
+    def __init__(self, analyzer, file_path):
+        super().__init__(analyzer)
+        self.file_path = file_path
+        self.data = analyzer.data
+        self.data_generation = analyzer._data_generation  # Compared on the GUI thread to spot stale results
+        self.usage_key = analyzer.usage_key()
+        self.usage = analyzer._usage_cache.get(self.usage_key)
+        
+    def run(self):
+        """Read and clean the file, then compute the process analysis if spare parts data is loaded"""
+        try:
+            process_parts = clean_process_parts(read_process_file(self.file_path))
+            try:
+                process_analysis = self.compute_process_analysis(process_parts)
+            except MissingColumnError as e:
+                logger.warning("Process analysis skipped: %s", e)
+                process_analysis = None
+        except Exception as e:
+            logger.exception("Failed to load process parts file %s", self.file_path)
+            self.error.emit(str(e))
+            return
+        self.loaded.emit((process_parts, process_analysis, self.usage))
+        
+    def compute_process_analysis(self, process_parts):
+        """Compare the captured spare parts usage with process parts; None if no spare parts data was loaded
+        
+        Raises MissingColumnError if the item number or quantity column cannot be found.
+        """
+        if self.data is None or self.data.empty:
+            return None
+            
+        item_col, qty_col, stock_col = self.usage_key
+        if not item_col or not qty_col:
+            raise MissingColumnError("Spare parts data needs Item Number and Requested Quantity columns")
+        
+        # Per-item usage aggregates (reused when already cached), joined onto the process parts
+        if self.usage is None:
+            self.usage = item_usage(self.data, item_col, qty_col, stock_col)
+        return _compute_process_analysis(self.usage, process_parts)
+
+
+class PandasModel(QAbstractTableModel):
+    """Read-only table model serving a DataFrame to a QTableView
+    
+    With format_floats, floats use two decimals in decimal_cols and none elsewhere, and each
+    column is formatted in one pass the first time it is painted; otherwise cells are shown as
+    str(value) on demand. color_criticality color codes a 'Criticality' column. With fetch_rows,
+    rows are handed to the view that many at a time as it scrolls, instead of all at once.
+    """
+    
+    def __init__(self, df=None, decimal_cols=(), format_floats=True, color_criticality=False, fetch_rows=None,
+                 parent=None):
+        super().__init__(parent)
+        self.decimal_cols = set(decimal_cols)
+        self.format_floats = format_floats
+        self.color_criticality = color_criticality
+        self.fetch_rows = fetch_rows
+        self._headers = []
+        self.set_frame(df)
+        
+    def set_frame(self, df):
+        """Replace the displayed DataFrame (None clears the table); the frame is referenced, not copied
+        
+        Returns True if the columns differ from the previous frame's, i.e. the view needs resizing.
+        """
+        self.beginResetModel()
+        self._df = df
+        total_rows = 0 if df is None else len(df)
+        self._row_count = total_rows if self.fetch_rows is None else min(total_rows, self.fetch_rows)
+        previous_headers = self._headers
+        self._headers = [] if df is None else [str(col) for col in df.columns]
+        self._values = [] if df is None else [df.iloc[:, j].array for j in range(df.shape[1])]
+        self._formats = ['%.2f' if col in self.decimal_cols else '%.0f' for col in self._headers]
+        self._text = [None] * len(self._headers)  # Formatted columns, filled lazily
+        self._criticality_col = -1
+        if self.color_criticality and 'Criticality' in self._headers:
+            self._criticality_col = self._headers.index('Criticality')
+        self.endResetModel()
+        return self._headers != previous_headers
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+        
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._df is not None and self._row_count < len(self._df)
+        
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        count = min(self.fetch_rows, len(self._df) - self._row_count)
+        self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + count - 1)
+        self._row_count += count
+        self.endInsertRows()
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            if self.format_floats:
+                return self._column_text(index.column())[index.row()]
+            return str(self._values[index.column()][index.row()])
+        if role == Qt.ItemDataRole.BackgroundRole and index.column() == self._criticality_col:
+            return CRITICALITY_COLORS.get(self._values[index.column()][index.row()])
+        return None
+        
+    def _column_text(self, j):
+        """Display strings for column j, formatted once per frame"""
+        if self._text[j] is None:
+            values, fmt = self._values[j], self._formats[j]
+            if pd.api.types.is_float_dtype(values.dtype):
+                self._text[j] = [fmt % v for v in values.to_numpy(dtype=np.float64, na_value=np.nan).tolist()]
+            elif values.dtype.kind in 'Mm':
+                self._text[j] = [str(v) for v in values]  # Timestamps/Timedeltas, as the cells show them
+            else:
+                # Unbox the whole column to Python objects in one C call; str() on those is several
+                # times faster than on the NumPy/Arrow scalars that iterating the array yields
+                objects = np.asarray(values, dtype=object).tolist()
+                if values.dtype == object:
+                    self._text[j] = [fmt % v if isinstance(v, float) else str(v) for v in objects]
+                else:
+                    self._text[j] = [str(v) for v in objects]
+        return self._text[j]
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
 
-# Data analysis imports
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import seaborn as sns
 
 class SafetyStockAnalyzer(QMainWindow):
     def __init__(self):
@@ -40,6 +520,18 @@ class SafetyStockAnalyzer(QMainWindow):
         self.analysis_results = None
         self.process_parts = None  # New: Process parts data
         self.process_analysis = None  # New: Process analysis results
+        self._process_groups = {}  # Process name -> row positions in self.process_analysis
+        
+        # Column lookup for self.data, rebuilt whenever new data is loaded
+        self._analysis_cols = {}  # ANALYSIS_COLUMN_KEYWORDS role -> column (or None)
+        self._summary_cols = {}  # SUMMARY_COLUMN_KEYWORDS role -> column (or None)
+        self._usage_cache = {}  # usage_key() -> per-item usage aggregates
+        self._data_generation = 0  # Bumped whenever self.data is replaced or cleared
+        self._process_worker = None  # Background process parts loader
+        self._summary_dirty = False  # Data changed since the Summary tab was last built
+        self._about_dialog = None  # Help > About box, created on first use
+        self._close_pending = False  # Exit confirmation scheduled but not answered yet
+        self._close_confirmed = False  # User agreed to exit despite loaded data
         
         # Setup UI
         self.setup_ui()
@@ -181,12 +673,14 @@ class SafetyStockAnalyzer(QMainWindow):
         
         data_layout = QVBoxLayout(data_group)
         
-        # Data table
-        self.data_table = QTableWidget()
+        # Data table, backed directly by the loaded DataFrame
+        self.data_model = PandasModel(format_floats=False, fetch_rows=PREVIEW_FETCH_ROWS)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.data_model)
         self.data_table.setAlternatingRowColors(True)
         self.data_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.data_table.horizontalHeader().setStretchLastSection(True)
-        self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         
         data_layout.addWidget(self.data_table)
         
@@ -209,20 +703,26 @@ class SafetyStockAnalyzer(QMainWindow):
         self.summary_text.setReadOnly(True)
         summary_layout.addWidget(self.summary_text)
         self.analysis_tabs.addTab(summary_tab, "📈 Summary")
+        self.summary_tab_index = self.analysis_tabs.indexOf(summary_tab)
+        self.analysis_tabs.currentChanged.connect(self._maybe_update_summary)
         
         # Safety Stock tab
         safety_tab = QWidget()
         safety_layout = QVBoxLayout(safety_tab)
-        self.safety_table = QTableWidget()
+        self.safety_model = PandasModel(decimal_cols=SAFETY_DECIMAL_COLS)
+        self.safety_table = QTableView()
+        self.safety_table.setModel(self.safety_model)
         safety_layout.addWidget(self.safety_table)
         self.analysis_tabs.addTab(safety_tab, "🛡️ Safety Stock")
         
         # Charts tab
         charts_tab = QWidget()
-        charts_layout = QVBoxLayout(charts_tab)
-        self.charts_canvas = self.create_charts_canvas()
-        charts_layout.addWidget(self.charts_canvas)
+        self.charts_layout = QVBoxLayout(charts_tab)
+        self.charts_canvas = None  # Created when the tab is first shown
+        self.charts_ax = None  # Single axes on charts_canvas, cleared and reused on every redraw
         self.analysis_tabs.addTab(charts_tab, "📊 Charts")
+        self.charts_tab_index = self.analysis_tabs.indexOf(charts_tab)
+        self.analysis_tabs.currentChanged.connect(self._maybe_init_charts)
         
         # Process Analysis tab
         process_tab = QWidget()
@@ -271,8 +771,10 @@ class SafetyStockAnalyzer(QMainWindow):
         process_upload_layout.addStretch()
         process_layout.addWidget(process_upload_frame)
         
-        # Process analysis results table
-        self.process_table = QTableWidget()
+        # Process analysis results table, backed directly by the analysis DataFrame
+        self.process_model = PandasModel(decimal_cols=PROCESS_DECIMAL_COLS, color_criticality=True)
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_model)
         process_layout.addWidget(self.process_table)
         
         # Compact process selector for safety stock analysis
@@ -343,10 +845,34 @@ class SafetyStockAnalyzer(QMainWindow):
         
     def create_charts_canvas(self):
         """Create matplotlib canvas for charts"""
+        import matplotlib
+        matplotlib.use("QtAgg")  # Pin the backend so nothing later probes for another one
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
         figure = Figure(figsize=(8, 6))
         canvas = FigureCanvas(figure)
+        # Let the layout own the geometry so redraws never renegotiate the canvas size
+        canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        canvas.updateGeometry()
         return canvas
         
+    def _maybe_init_charts(self, index):
+        """Build the charts canvas the first time the Charts tab is selected"""
+        if index != self.charts_tab_index or self.charts_canvas is not None:
+            return
+        self.charts_canvas = self.create_charts_canvas()
+        self.charts_ax = self.charts_canvas.figure.add_subplot(111)
+        self.charts_ax.axis('off')
+        self.charts_layout.addWidget(self.charts_canvas)
+        self.create_charts()
+        
+    def _maybe_update_summary(self, index):
+        """Rebuild the summary when the Summary tab is shown and the data changed since the last build"""
+        if index != self.summary_tab_index or not self._summary_dirty:
+            return
+        self._summary_dirty = False
+        self.update_summary()
+        
     def create_control_buttons(self):
         """Create control buttons"""
         button_frame = QFrame()
@@ -463,13 +989,21 @@ class SafetyStockAnalyzer(QMainWindow):
         """Setup the status bar"""
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready to load files")
+        
+        # Status text lives in a label: setText schedules a normal repaint, where
+        # showMessage repaints the status bar synchronously on every call
+        self.status_label = QLabel("Ready to load files")
+        self.status_bar.addWidget(self.status_label, 1)
         
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
         
+    def set_status(self, text):
+        """Show text in the status bar"""
+        self.status_label.setText(text)
+        
     def apply_modern_style(self):
         """Apply modern styling to the application"""
         self.setStyleSheet("""
@@ -488,7 +1022,7 @@ class SafetyStockAnalyzer(QMainWindow):
                 left: 10px;
                 padding: 0 5px 0 5px;
             }
-            QTableWidget {
+            QTableView {
                 gridline-color: #DEE2E6;
                 background-color: white;
                 alternate-background-color: #F8F9FA;
@@ -556,192 +1090,65 @@ class SafetyStockAnalyzer(QMainWindow):
         )
         
         if file_path:
-            try:
-                self.status_bar.showMessage("Loading process parts file...")
-                
-                # Load process parts file
-                if file_path.lower().endswith(('.xlsx', '.xls')):
-                    self.process_parts = pd.read_excel(file_path)
-                else:
-                    self.process_parts = pd.read_csv(file_path)
-                
-                # Clean process parts data
-                self.process_parts = self.clean_process_parts(self.process_parts)
-                
-                # Run process analysis if spare parts data is available
-                if self.data is not None and not self.data.empty:
-                    self.run_process_analysis()
-                
-                self.status_bar.showMessage(f"Process parts loaded: {len(self.process_parts)} records")
-                QMessageBox.information(self, "Success", f"Process parts file loaded successfully!\n\nRecords: {len(self.process_parts):,}\nProcesses: {self.process_parts['Process'].nunique():,}")
-                
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load process parts file: {str(e)}")
-                self.status_bar.showMessage("Error loading process parts file")
-                
-    def clean_process_parts(self, df):
-        """Clean and validate process parts data"""
-        try:
-            df_clean = df.copy()
-            
-            # Ensure required columns exist
-            required_cols = ['Process', 'Item Number', 'Part Name']
-            missing_cols = [col for col in required_cols if col not in df_clean.columns]
-            
-            if missing_cols:
-                # Try to find similar columns
-                for col in missing_cols:
-                    if col == 'Process':
-                        # Look for process-related columns
-                        process_cols = [c for c in df_clean.columns if 'process' in c.lower() or 'operation' in c.lower()]
-                        if process_cols:
-                            df_clean['Process'] = df_clean[process_cols[0]]
-                        else:
-                            df_clean['Process'] = 'Unknown'
-                    elif col == 'Item Number':
-                        # Look for item-related columns
-                        item_cols = [c for c in df_clean.columns if 'item' in c.lower() or 'part' in c.lower() or 'number' in c.lower()]
-                        if item_cols:
-                            df_clean['Item Number'] = df_clean[item_cols[0]]
-                        else:
-                            df_clean['Item Number'] = 'Unknown'
-                    elif col == 'Part Name':
-                        # Look for name-related columns
-                        name_cols = [c for c in df_clean.columns if 'name' in c.lower() or 'description' in c.lower()]
-                        if name_cols:
-                            df_clean['Part Name'] = df_clean[name_cols[0]]
-                        else:
-                            df_clean['Part Name'] = 'Unknown'
-            
-            # Clean data
-            df_clean['Process'] = df_clean['Process'].astype(str).str.strip()
-            df_clean['Item Number'] = df_clean['Item Number'].astype(str).str.strip()
-            df_clean['Part Name'] = df_clean['Part Name'].astype(str).str.strip()
-            
-            # Remove rows with missing critical data
-            df_clean = df_clean.dropna(subset=['Process', 'Item Number'])
-            
-            return df_clean
-            
-        except Exception as e:
-            print(f"Error cleaning process parts: {e}")
-            return df
+            self.set_status("Loading process parts file...")
+            self.process_upload_btn.setEnabled(False)
+            self.progress_bar.setRange(0, 0)  # Indeterminate while the worker runs
+            self.progress_bar.setVisible(True)
             
-    def run_process_analysis(self):
-        """Run process-based analysis comparing spare parts usage with process parts"""
-        if self.data is None or self.data.empty or self.process_parts is None:
+            # Load, clean and analyze in the background
+            self._process_worker = ProcessLoadWorker(self, file_path)
+            self._process_worker.loaded.connect(self.on_process_parts_loaded)
+            self._process_worker.error.connect(self.on_process_parts_error)
+            self._process_worker.finished.connect(self.on_process_worker_finished)
+            self._process_worker.finished.connect(self._process_worker.deleteLater)  # Parented to the window
+            self._process_worker.start()
+            
+    def on_process_parts_loaded(self, result):
+        """Show process parts and analysis computed by the background worker"""
+        process_parts, process_analysis, usage = result
+        worker = self.sender()
+        if worker.data_generation != self._data_generation:
+            # Data was loaded or cleared while the worker ran, so its results no longer apply
+            self.set_status("Process parts load discarded: the data changed while it was running")
             return
-            
-        try:
-            self.status_bar.showMessage("Running process analysis...")
-            
-            # Find the correct column names from spare parts data
-            item_col = None
-            qty_col = None
-            stock_col = None
-            part_col = None
-            desc_col = None
-            
-            for col in self.data.columns:
-                if 'item' in col.lower() and 'number' in col.lower():
-                    item_col = col
-                elif 'req' in col.lower() and 'qty' in col.lower():
-                    qty_col = col
-                elif 'hand' in col.lower():
-                    stock_col = col
-                elif 'part' in col.lower() and 'name' in col.lower():
-                    part_col = col
-                elif 'description' in col.lower() and '2' in col:
-                    desc_col = col
-            
-            if not item_col or not qty_col:
-                return
-            
-            # Create detailed process analysis showing individual parts
-            detailed_analysis = []
-            
-            for _, process_row in self.process_parts.iterrows():
-                process_name = process_row['Process']
-                item_number = process_row['Item Number']
-                part_name = process_row['Part Name']
-                
-                # Find matching spare parts data
-                matching_data = self.data[self.data[item_col] == item_number]
-                
-                if not matching_data.empty:
-                    # Calculate usage metrics for this specific part
-                    total_usage = matching_data[qty_col].sum()
-                    usage_count = len(matching_data)
-                    avg_usage = total_usage / usage_count if usage_count > 0 else 0
-                    current_stock = matching_data[stock_col].iloc[0] if stock_col and stock_col in matching_data.columns else 0
-                    
-                    # Calculate daily metrics
-                    daily_usage = total_usage / 30 if total_usage > 0 else 0  # Assuming 30 days
-                    daily_std = matching_data[qty_col].std() if len(matching_data) > 1 else 0
-                    
-                    # Calculate safety stock (using 95% confidence level, Z = 1.65)
-                    Z = 1.65
-                    lead_time = 30  # Default lead time in days
-                    safety_stock = Z * np.sqrt(lead_time) * daily_std
-                    reorder_point = (daily_usage * lead_time) + safety_stock
-                    
-                    # Determine criticality
-                    if daily_usage > 10:
-                        criticality = "CRITICAL"
-                    elif daily_usage > 5:
-                        criticality = "HIGH"
-                    elif daily_usage > 2:
-                        criticality = "MEDIUM"
-                    else:
-                        criticality = "LOW"
-                    
-                    detailed_analysis.append({
-                        'Process': process_name,
-                        'Item Number': item_number,
-                        'Part Name': part_name,
-                        'Total Usage': total_usage,
-                        'Usage Count': usage_count,
-                        'Avg Usage per Request': avg_usage,
-                        'Current Stock': current_stock,
-                        'D_Mean_per_Day': daily_usage,
-                        'D_Std_per_Day': daily_std,
-                        'Safety Stock': safety_stock,
-                        'Reorder Point': reorder_point,
-                        'Criticality': criticality
-                    })
-                else:
-                    # Part exists in process but no usage data found
-                    detailed_analysis.append({
-                        'Process': process_name,
-                        'Item Number': item_number,
-                        'Part Name': part_name,
-                        'Total Usage': 0,
-                        'Usage Count': 0,
-                        'Avg Usage per Request': 0,
-                        'Current Stock': 0,
-                        'D_Mean_per_Day': 0,
-                        'D_Std_per_Day': 0,
-                        'Safety Stock': 0,
-                        'Reorder Point': 0,
-                        'Criticality': 'NO DATA'
-                    })
-            
-            # Convert to DataFrame and sort
-            self.process_analysis = pd.DataFrame(detailed_analysis)
-            if not self.process_analysis.empty:
-                self.process_analysis = self.process_analysis.sort_values(['Process', 'Total Usage'], ascending=[True, False])
-            
-            self.display_process_analysis()
-            
-            # Update process selector dropdown
-            self.update_process_selector()
-            
-            self.status_bar.showMessage(f"Process analysis completed: {len(self.process_analysis)} parts analyzed")
-            
-        except Exception as e:
-            print(f"Error in process analysis: {e}")
-            self.status_bar.showMessage("Process analysis failed")
-            
+        self.process_parts = process_parts
+        if usage is not None:
+            self._usage_cache[worker.usage_key] = usage
+        
+        if process_analysis is not None:
+            self.show_process_analysis(process_analysis)
+        
+        # Success is reported in the status bar; message boxes are kept for errors
+        self.set_status(f"Process parts loaded: {len(self.process_parts):,} records, "
+                        f"{self.process_parts['Process'].nunique():,} processes")
+        
+    def on_process_parts_error(self, message):
+        """Report a failed background process parts load"""
+        QMessageBox.critical(self, "Error", f"Failed to load process parts file: {message}")
+        self.set_status("Error loading process parts file")
+        
+    def on_process_worker_finished(self):
+        """Restore the progress bar and upload button once the worker exits"""
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+        self.process_upload_btn.setEnabled(True)
+        self._process_worker = None
+        
+    def show_process_analysis(self, process_analysis):
+        """Store and display process analysis results"""
+        self.process_analysis = process_analysis
+        self._process_groups = process_analysis.groupby('Process', observed=True, sort=False).indices
+        self.display_process_analysis()
+        
+        # Update process selector dropdown
+        self.update_process_selector()
+        
+        self.set_status(f"Process analysis completed: {len(self.process_analysis)} parts analyzed")
+        
+    def usage_key(self):
+        """(item, qty, stock) columns of the loaded data, the key of its usage aggregates"""
+        return tuple(self._analysis_cols.get(role) for role in ('item', 'qty', 'stock'))
+        
     def calculate_process_criticality(self, total_usage):
         """Calculate process criticality based on total usage"""
         if total_usage > 1000:
@@ -758,41 +1165,11 @@ class SafetyStockAnalyzer(QMainWindow):
         if self.process_analysis is None:
             return
             
-        # Set up table with detailed columns
-        self.process_table.setRowCount(len(self.process_analysis))
-        columns = ['Process', 'Item Number', 'Part Name', 'Total Usage', 'Usage Count', 'Avg Usage per Request', 
-                  'Current Stock', 'D_Mean_per_Day', 'D_Std_per_Day', 'Safety Stock', 'Reorder Point', 'Criticality']
-        self.process_table.setColumnCount(len(columns))
-        self.process_table.setHorizontalHeaderLabels(columns)
-        
-        # Populate table
-        for i, row in self.process_analysis.iterrows():
-            for j, col in enumerate(columns):
-                value = row[col]
-                if isinstance(value, float):
-                    if col in ['Avg Usage per Request', 'D_Mean_per_Day', 'D_Std_per_Day', 'Safety Stock', 'Reorder Point']:
-                        value = f"{value:.2f}"
-                    else:
-                        value = f"{value:.0f}"
-                item = QTableWidgetItem(str(value))
-                
-                # Color code criticality levels
-                if col == 'Criticality':
-                    if value == 'CRITICAL':
-                        item.setBackground(QColor(255, 200, 200))  # Light red
-                    elif value == 'HIGH':
-                        item.setBackground(QColor(255, 255, 200))  # Light yellow
-                    elif value == 'MEDIUM':
-                        item.setBackground(QColor(200, 255, 200))  # Light green
-                    elif value == 'LOW':
-                        item.setBackground(QColor(200, 200, 255))  # Light blue
-                    elif value == 'NO DATA':
-                        item.setBackground(QColor(240, 240, 240))  # Light gray
-                
-                self.process_table.setItem(i, j, item)
-                
-        # Auto-resize columns
-        self.process_table.resizeColumnsToContents()
+        columns_changed = self.process_model.set_frame(self.process_analysis[PROCESS_COLUMNS])
+        
+        # Auto-resize columns when they are first shown; refreshes keep the current widths
+        if columns_changed:
+            self.process_table.resizeColumnsToContents()
         
     def update_process_selector(self):
         """Update the process selector dropdown with available processes"""
@@ -813,7 +1190,7 @@ class SafetyStockAnalyzer(QMainWindow):
         
     def on_process_selection_changed(self, process_name):
         """Handle process selection change"""
-        print(f"Debug - Process selection changed to: '{process_name}'")
+        logger.debug("Process selection changed to: '%s'", process_name)
         if process_name == "All Processes":
             self.apply_filter_btn.setEnabled(True)  # Allow showing all processes
         else:
@@ -834,20 +1211,20 @@ class SafetyStockAnalyzer(QMainWindow):
             return
             
         try:
-            self.status_bar.showMessage(f"Filtering process analysis for: {selected_process}")
+            self.set_status(f"Filtering process analysis for: {selected_process}")
             
-            # Debug: Print unique processes in data
-            print(f"Debug - Available processes: {self.process_analysis['Process'].unique()}")
-            print(f"Debug - Selected process: '{selected_process}'")
-            print(f"Debug - Total records before filter: {len(self.process_analysis)}")
+            # Debug: Log unique processes in data (only computed when debug logging is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available processes: %s", list(self._process_groups))
+            logger.debug("Selected process: '%s'", selected_process)
+            logger.debug("Total records before filter: %s", len(self.process_analysis))
             
-            # Filter the process analysis to show only items from the selected process
-            filtered_results = self.process_analysis[self.process_analysis['Process'] == selected_process].copy()
+            # Filter the process analysis to show only items from the selected process, using the
+            # row positions grouped when the analysis was shown (no index reset: the model reads by position)
+            positions = self._process_groups.get(selected_process, [])
+            filtered_results = self.process_analysis.take(positions)
             
-            # Reset index to ensure proper display
-            filtered_results = filtered_results.reset_index(drop=True)
-            
-            print(f"Debug - Records after filter: {len(filtered_results)}")
+            logger.debug("Records after filter: %s", len(filtered_results))
             
             if filtered_results.empty:
                 QMessageBox.information(self, "Info", f"No parts found for process: {selected_process}")
@@ -856,97 +1233,49 @@ class SafetyStockAnalyzer(QMainWindow):
             # Display filtered process results
             self.display_filtered_process_results(filtered_results, selected_process)
             
-            self.status_bar.showMessage(f"Filtered process analysis for {selected_process}: {len(filtered_results)} parts")
+            self.set_status(f"Filtered process analysis for {selected_process}: {len(filtered_results)} parts")
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to apply process filter: {str(e)}")
-            self.status_bar.showMessage("Process filter failed")
+            self.set_status("Process filter failed")
             
     def display_filtered_process_results(self, filtered_results, process_name):
         """Display filtered process analysis results for a specific process"""
         if filtered_results is None or filtered_results.empty:
             return
             
-        print(f"Debug - Displaying {len(filtered_results)} filtered results for {process_name}")
-        print(f"Debug - First few items: {filtered_results[['Process', 'Item Number', 'Part Name']].head()}")
-        
-        # Clear table first
-        self.process_table.clear()
+        logger.debug("Displaying %s filtered results for %s", len(filtered_results), process_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First few items:\n%s", filtered_results[['Process', 'Item Number', 'Part Name']].head())
         
-        # Set up table with same columns as process analysis
-        self.process_table.setRowCount(len(filtered_results))
-        columns = ['Process', 'Item Number', 'Part Name', 'Total Usage', 'Usage Count', 'Avg Usage per Request', 
-                  'Current Stock', 'D_Mean_per_Day', 'D_Std_per_Day', 'Safety Stock', 'Reorder Point', 'Criticality']
-        self.process_table.setColumnCount(len(columns))
-        self.process_table.setHorizontalHeaderLabels(columns)
+        # Same columns as the full process analysis
+        columns_changed = self.process_model.set_frame(filtered_results[PROCESS_COLUMNS])
         
         # Add process name to header
         self.process_table.setWindowTitle(f"Process Analysis - {process_name}")
         
-        # Populate table - use iloc for position-based indexing
-        for i in range(len(filtered_results)):
-            row = filtered_results.iloc[i]
-            for j, col in enumerate(columns):
-                value = row[col]
-                if isinstance(value, float):
-                    if col in ['Avg Usage per Request', 'D_Mean_per_Day', 'D_Std_per_Day', 'Safety Stock', 'Reorder Point']:
-                        value = f"{value:.2f}"
-                    else:
-                        value = f"{value:.0f}"
-                item = QTableWidgetItem(str(value))
-                
-                # Color code criticality levels
-                if col == 'Criticality':
-                    if value == 'CRITICAL':
-                        item.setBackground(QColor(255, 200, 200))  # Light red
-                    elif value == 'HIGH':
-                        item.setBackground(QColor(255, 255, 200))  # Light yellow
-                    elif value == 'MEDIUM':
-                        item.setBackground(QColor(200, 255, 200))  # Light green
-                    elif value == 'LOW':
-                        item.setBackground(QColor(200, 200, 255))  # Light blue
-                    elif value == 'NO DATA':
-                        item.setBackground(QColor(240, 240, 240))  # Light gray
-                
-                self.process_table.setItem(i, j, item)
-                
-        # Auto-resize columns
-        self.process_table.resizeColumnsToContents()
+        # Auto-resize columns when they are first shown; refreshes keep the current widths
+        if columns_changed:
+            self.process_table.resizeColumnsToContents()
         
     def display_filtered_analysis_results(self, filtered_results, process_name):
         """Display filtered analysis results for a specific process"""
         if filtered_results is None or filtered_results.empty:
             return
             
-        # Set up table
-        self.safety_table.setRowCount(len(filtered_results))
-        columns = ['Item Number', 'Part Name', 'Description 2', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 
-                  'D_Std_per_Day', 'Current Stock', 'Safety Stock', 'Reorder Point', 'Criticality']
-        self.safety_table.setColumnCount(len(columns))
-        self.safety_table.setHorizontalHeaderLabels(columns)
+        columns_changed = self.safety_model.set_frame(filtered_results[SAFETY_COLUMNS])
         
         # Add process name to header
         self.safety_table.setWindowTitle(f"Safety Stock Analysis - {process_name}")
         
-        # Populate table
-        for i, row in filtered_results.iterrows():
-            for j, col in enumerate(columns):
-                value = row[col]
-                if isinstance(value, float):
-                    if col in ['D_Mean_per_Day', 'D_Std_per_Day', 'Safety Stock', 'Reorder Point']:
-                        value = f"{value:.2f}"
-                    else:
-                        value = f"{value:.0f}"
-                item = QTableWidgetItem(str(value))
-                self.safety_table.setItem(i, j, item)
-                
-        # Auto-resize columns
-        self.safety_table.resizeColumnsToContents()
+        # Auto-resize columns when they are first shown; refreshes keep the current widths
+        if columns_changed:
+            self.safety_table.resizeColumnsToContents()
             
     def load_files(self, file_paths):
         """Load and process files"""
         try:
-            self.status_bar.showMessage("Loading files...")
+            self.set_status("Loading files...")
             self.progress_bar.setVisible(True)
             self.progress_bar.setMaximum(len(file_paths))
             
@@ -954,146 +1283,136 @@ class SafetyStockAnalyzer(QMainWindow):
             
             for i, file_path in enumerate(file_paths):
                 self.progress_bar.setValue(i + 1)
-                self.status_bar.showMessage(f"Loading {os.path.basename(file_path)}...")
+                self.set_status(f"Loading {os.path.basename(file_path)}...")
                 
                 # Load file based on extension
-                if file_path.lower().endswith(('.xlsx', '.xls')):
-                    df = pd.read_excel(file_path)
-                elif file_path.lower().endswith('.csv'):
-                    df = pd.read_csv(file_path)
-                else:
-                    df = pd.read_csv(file_path, sep='\t')
+                df = read_data_file(file_path)
+                
+                # Filter for emergency requests (EM in remarks, any case) before cleaning the rest
+                remark_col = 'Remark' if 'Remark' in df.columns else 'Remarks' if 'Remarks' in df.columns else None
+                if remark_col:
+                    # astype(str): an all-empty Remarks column is read as float64, not text
+                    df = df[df[remark_col].astype(str).str.contains('em', case=False, regex=False, na=False)]
                 
                 # Clean and convert data types
                 df = self.clean_dataframe(df)
                     
-                # Filter for emergency requests (EM or em in remarks)
-                if 'Remark' in df.columns:
-                    df = df[df['Remark'].str.contains('EM|em', na=False, regex=True)]
-                elif 'Remarks' in df.columns:
-                    df = df[df['Remarks'].str.contains('EM|em', na=False, regex=True)]
-                    
                 all_data.append(df)
                 
             if all_data:
                 self.data = pd.concat(all_data, ignore_index=True)
+                self._analysis_cols = detect_columns(self.data.columns, ANALYSIS_COLUMN_KEYWORDS)
+                self._summary_cols = detect_columns(self.data.columns, SUMMARY_COLUMN_KEYWORDS, match=any)
+                self._usage_cache = {}
+                self._data_generation += 1
+                self._normalise_item_numbers()
+                self._downcast_quantities()
                 self.display_data()
                 self.analyze_btn.setEnabled(True)
-                self.status_bar.showMessage(f"Loaded {len(self.data)} emergency request records")
+                self.set_status(f"Loaded {len(self.data)} emergency request records")
             else:
-                self.status_bar.showMessage("No emergency request data found")
+                self.set_status("No emergency request data found")
                 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load files: {str(e)}")
-            self.status_bar.showMessage("Error loading files")
+            self.set_status("Error loading files")
         finally:
             self.progress_bar.setVisible(False)
             
     def clean_dataframe(self, df):
-        """Clean and convert data types in the dataframe - SIMPLIFIED APPROACH"""
-        try:
-            # Make a copy to avoid modifying original
-            df_clean = df.copy()
-            
-            print("=== STARTING DATA CLEANING ===")
-            print(f"Original columns: {list(df_clean.columns)}")
-            
-            # SIMPLE APPROACH: Just convert everything to strings first, then handle specific cases
-            for col in df_clean.columns:
-                # Convert everything to string first
-                df_clean[col] = df_clean[col].astype(str)
+        """Clean and convert data types in the dataframe - SIMPLIFIED APPROACH
+        
+        A column that fails to convert is logged and kept as loaded; the other columns are still cleaned.
+        """
+        # Make a copy to avoid modifying original
+        df_clean = df.copy()
+        
+        logger.debug("Starting data cleaning, original columns: %s", list(df_clean.columns))
+        
+        # Classify columns once by name, then convert each group directly from its loaded dtype
+        lowered = [(col, col.lower()) for col in df_clean.columns]
+        date_cols = [col for col, low in lowered if any(k in low for k in ['date', 'time', 'requested'])]
+        qty_cols = [col for col, low in lowered if col not in date_cols
+                    and any(k in low for k in ['quantity', 'qty', 'amount', 'req'])]
+        text_cols = [col for col in df_clean.columns if col not in date_cols and col not in qty_cols
+                     and (df_clean[col].dtype == object or pd.api.types.is_string_dtype(df_clean[col]))]
+        
+        # Handle date columns - SIMPLE METHOD
+        for col in date_cols:
+            logger.debug("Processing DATE column: %s", col)
+            if pd.api.types.is_datetime64_any_dtype(df_clean[col]):
+                logger.debug("%s is already datetime", col)  # e.g. real date cells in Excel
+                continue
                 
-                # Handle date columns - SIMPLE METHOD
-                if any(keyword in col.lower() for keyword in ['date', 'time', 'requested']):
-                    print(f"\nProcessing DATE column: {col}")
-                    print(f"Sample values: {df_clean[col].head(3).tolist()}")
-                    
-                    # Try to convert the first few values to see what format we have
-                    sample_values = df_clean[col].head(5).tolist()
-                    
-                    # Check if they look like huge numbers (your case)
-                    if any(len(str(val)) > 10 for val in sample_values):
-                        print(f"Detected huge numbers in {col} - treating as text for now")
-                        # Keep as text for now - we'll handle this in analysis
-                        df_clean[col] = df_clean[col].astype(str)
-                    else:
-                        # Try normal date conversion
-                        try:
-                            df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
-                            print(f"Successfully converted {col} to datetime")
-                        except:
-                            print(f"Failed to convert {col} to datetime - keeping as text")
-                            df_clean[col] = df_clean[col].astype(str)
-                
-                # Handle quantity columns - SIMPLE METHOD
-                elif any(keyword in col.lower() for keyword in ['quantity', 'qty', 'amount', 'req']):
-                    print(f"\nProcessing QUANTITY column: {col}")
-                    try:
-                        # Convert to numeric, handle errors
-                        df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-                        # Fill NaN with 0
-                        df_clean[col] = df_clean[col].fillna(0)
-                        # Remove negative values
-                        df_clean[col] = df_clean[col].abs()
-                        print(f"Successfully converted {col} to numeric")
-                    except:
-                        print(f"Failed to convert {col} to numeric - keeping as text")
-                        df_clean[col] = df_clean[col].astype(str)
-                
-                # Handle text columns
+            try:
+                # Check if they look like huge numbers (your case); str() as blanks stay NaN under astype(str)
+                sample_values = df_clean[col].head(5).astype(str).tolist()
+                logger.debug("Sample values: %s", sample_values[:3])
+                if any(len(str(val)) > 10 for val in sample_values):
+                    logger.debug("Detected huge numbers in %s - treating as text for now", col)
+                    # Keep as text for now - we'll handle this in analysis
+                    df_clean[col] = df_clean[col].astype(str)
+                elif pd.api.types.is_numeric_dtype(df_clean[col]):
+                    # Numbers would be read as epoch offsets; parse their text instead, as before
+                    df_clean[col] = pd.to_datetime(df_clean[col].astype(str), errors='coerce')
+                    logger.debug("Successfully converted %s to datetime", col)
                 else:
-                    # Just ensure it's string and limit length
-                    df_clean[col] = df_clean[col].str[:100]  # Limit to 100 characters
-                    df_clean[col] = df_clean[col].fillna('')
-            
-            print("\n=== DATA CLEANING COMPLETED ===")
-            print(f"Final column types:")
-            for col in df_clean.columns:
-                print(f"  {col}: {df_clean[col].dtype}")
-            
-            return df_clean
-            
-        except Exception as e:
-            print(f"Error in clean_dataframe: {e}")
-            return df
-            
+                    df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
+                    logger.debug("Successfully converted %s to datetime", col)
+            except (TypeError, ValueError) as e:
+                logger.warning("Failed to convert %s to datetime - keeping as loaded: %s", col, e)
+        
+        # Handle quantity columns - numeric, NaN -> 0, no negative values
+        for col in qty_cols:
+            logger.debug("Processing QUANTITY column: %s", col)
+            try:
+                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce').fillna(0).abs()
+            except (TypeError, ValueError) as e:
+                logger.warning("Failed to convert %s to numeric - keeping as loaded: %s", col, e)
+        
+        # Handle text columns: limit length; other columns keep their native dtype. Object columns
+        # can mix numbers and strings (e.g. Excel item numbers), so stringify before slicing
+        for col in text_cols:
+            df_clean[col] = df_clean[col].astype(str).str[:100].fillna('')  # Limit to 100 characters
+        
+        logger.debug("Data cleaning completed, final column types: %s", df_clean.dtypes.to_dict())
+        
+        return df_clean
+            
+    def _normalise_item_numbers(self):
+        """Store the item number column as text, the dtype process parts item numbers are joined on"""
+        item_col = self._analysis_cols.get('item')
+        if item_col and not pd.api.types.is_string_dtype(self.data[item_col]):
+            self.data[item_col] = self.data[item_col].astype(str)  # e.g. integer item numbers from a CSV
+            
+    def _downcast_quantities(self):
+        """Store integer quantity/stock columns in the smallest integer dtype that fits"""
+        for col in {self._analysis_cols.get('qty'), self._analysis_cols.get('stock')} - {None}:
+            if pd.api.types.is_integer_dtype(self.data[col]):
+                # Floats are left at float64 so sums and deviations keep full precision
+                self.data[col] = pd.to_numeric(self.data[col], downcast='integer')
+                
     def display_data(self):
         """Display loaded data in the table"""
         if self.data is None or self.data.empty:
             return
             
-        # Set up table
-        self.data_table.setRowCount(len(self.data))
-        self.data_table.setColumnCount(len(self.data.columns))
-        self.data_table.setHorizontalHeaderLabels(self.data.columns)
-        
-        # Populate table
-        for i in range(len(self.data)):
-            for j in range(len(self.data.columns)):
-                value = str(self.data.iloc[i, j])
-                item = QTableWidgetItem(value)
-                self.data_table.setItem(i, j, item)
+        self.data_model.set_frame(self.data)
+        self.data_table.resizeColumnsToContents()
                 
-        # Update summary
-        self.update_summary()
+        # Update summary now if its tab is showing, otherwise when it is next opened
+        self._summary_dirty = True
+        self._maybe_update_summary(self.analysis_tabs.currentIndex())
         
     def update_summary(self):
         """Update the summary tab"""
         if self.data is None or self.data.empty:
             return
             
-        # Find date and quantity columns dynamically
-        date_col = None
-        quantity_col = None
-        item_col = None
-        
-        for col in self.data.columns:
-            if any(keyword in col.lower() for keyword in ['date', 'time', 'requested', 'created']):
-                date_col = col
-            elif any(keyword in col.lower() for keyword in ['quantity', 'qty', 'amount', 'requested']):
-                quantity_col = col
-            elif any(keyword in col.lower() for keyword in ['item', 'part', 'number', 'code']):
-                item_col = col
+        # Date, quantity and item columns found when the data was loaded
+        date_col = self._summary_cols.get('date')
+        quantity_col = self._summary_cols.get('quantity')
+        item_col = self._summary_cols.get('item')
         
         summary_text = f"""
 📊 DATA SUMMARY
@@ -1119,13 +1438,13 @@ class SafetyStockAnalyzer(QMainWindow):
         if item_col:
             try:
                 summary_text += f"🔢 Unique Items: {self.data[item_col].nunique():,}\n"
-            except:
+            except (TypeError, ValueError):  # Unhashable/non-numeric values
                 summary_text += f"🔢 Item Column: {item_col}\n"
         
         if quantity_col:
             try:
                 summary_text += f"📦 Total Quantity Requested: {self.data[quantity_col].sum():,}\n"
-            except:
+            except (TypeError, ValueError):  # Unhashable/non-numeric values
                 summary_text += f"📦 Quantity Column: {quantity_col}\n"
         
         summary_text += f"""
@@ -1133,18 +1452,35 @@ class SafetyStockAnalyzer(QMainWindow):
 {'='*50}
 """
         
+        # Partition columns by dtype once, then reduce each group in a single call; numeric stats run
+        # per dtype block, since one reduction over mixed int/float columns would upcast ints to float
+        dtypes = self.data.dtypes
+        numeric_cols = [col for col in self.data.columns if pd.api.types.is_numeric_dtype(dtypes[col])]
+        numeric_stats = {}
+        for dtype in dict.fromkeys(dtypes[numeric_cols]):
+            block = self.data[[col for col in numeric_cols if dtypes[col] == dtype]]
+            for col, *stats in zip(block.columns, block.min(), block.max(), block.mean(), block.sum()):
+                numeric_stats[col] = stats
+        try:
+            unique_counts = self.data[[col for col in self.data.columns if col not in numeric_stats]].nunique()
+        except Exception:
+            unique_counts = {}  # Fall back to one column at a time below
+        
         for col in self.data.columns:
             try:
-                if pd.api.types.is_numeric_dtype(self.data[col]):
+                if col in numeric_stats:
+                    col_min, col_max, col_mean, col_sum = numeric_stats[col]
                     summary_text += f"\n{col}:"
-                    summary_text += f"\n  - Min: {self.data[col].min():,}"
-                    summary_text += f"\n  - Max: {self.data[col].max():,}"
-                    summary_text += f"\n  - Mean: {self.data[col].mean():.2f}"
-                    summary_text += f"\n  - Total: {self.data[col].sum():,}"
-                elif pd.api.types.is_datetime64_any_dtype(self.data[col]):
-                    summary_text += f"\n{col}: Date column with {self.data[col].nunique():,} unique dates"
+                    summary_text += f"\n  - Min: {col_min:,}"
+                    summary_text += f"\n  - Max: {col_max:,}"
+                    summary_text += f"\n  - Mean: {col_mean:.2f}"
+                    summary_text += f"\n  - Total: {col_sum:,}"
                 else:
-                    summary_text += f"\n{col}: {self.data[col].nunique():,} unique values"
+                    unique = unique_counts[col] if col in unique_counts else self.data[col].nunique()
+                    if pd.api.types.is_datetime64_any_dtype(dtypes[col]):
+                        summary_text += f"\n{col}: Date column with {unique:,} unique dates"
+                    else:
+                        summary_text += f"\n{col}: {unique:,} unique values"
             except Exception as e:
                 summary_text += f"\n{col}: Error processing column - {str(e)}"
                 
@@ -1157,78 +1493,46 @@ class SafetyStockAnalyzer(QMainWindow):
             return
             
         try:
-            self.status_bar.showMessage("Running analysis...")
+            self.set_status("Running analysis...")
             self.progress_bar.setVisible(True)
             self.progress_bar.setMaximum(100)
             
-            # Find the correct column names from your data
-            item_col = None
-            qty_col = None
-            stock_col = None
-            part_col = None
-            desc_col = None
-            
-            for col in self.data.columns:
-                if 'item' in col.lower() and 'number' in col.lower():
-                    item_col = col
-                elif 'req' in col.lower() and 'qty' in col.lower():
-                    qty_col = col
-                elif 'hand' in col.lower():
-                    stock_col = col
-                elif 'part' in col.lower() and 'name' in col.lower():
-                    part_col = col
-                elif 'description' in col.lower() and '2' in col:
-                    desc_col = col
+            # Column names found when the data was loaded
+            item_col = self._analysis_cols.get('item')
+            qty_col = self._analysis_cols.get('qty')
+            stock_col = self._analysis_cols.get('stock')
+            part_col = self._analysis_cols.get('part')
+            desc_col = self._analysis_cols.get('desc')
             
             if not item_col or not qty_col:
                 QMessageBox.critical(self, "Error", "Required columns not found. Need Item Number and Requested Quantity columns.")
                 return
             
-            # Group by item number for analysis
-            grouped = self.data.groupby(item_col).agg({
-                qty_col: ['sum', 'count', 'mean', 'std'],
-                stock_col: 'first' if stock_col else 'first',
-                part_col: 'first' if part_col else 'first',
-                desc_col: 'first' if desc_col else 'first'
-            }).reset_index()
-            
-            # Flatten column names
-            if stock_col and part_col and desc_col:
-                grouped.columns = ['Item Number', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 'D_Std_per_Day', 'Current Stock', 'Part Name', 'Description 2']
-            elif stock_col and part_col:
-                grouped.columns = ['Item Number', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 'D_Std_per_Day', 'Current Stock', 'Part Name']
-                grouped['Description 2'] = 'Unknown'
-            elif stock_col and desc_col:
-                grouped.columns = ['Item Number', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 'D_Std_per_Day', 'Current Stock', 'Description 2']
-                grouped['Part Name'] = 'Unknown'
-            elif part_col and desc_col:
-                grouped.columns = ['Item Number', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 'D_Std_per_Day', 'Part Name', 'Description 2']
-                grouped['Current Stock'] = 0
-            elif stock_col:
-                grouped.columns = ['Item Number', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 'D_Std_per_Day', 'Current Stock']
-                grouped['Part Name'] = 'Unknown'
-                grouped['Description 2'] = 'Unknown'
-            elif part_col:
-                grouped.columns = ['Item Number', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 'D_Std_per_Day', 'Part Name']
-                grouped['Current Stock'] = 0
-                grouped['Description 2'] = 'Unknown'
-            elif desc_col:
-                grouped.columns = ['Item Number', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 'D_Std_per_Day', 'Description 2']
-                grouped['Current Stock'] = 0
-                grouped['Part Name'] = 'Unknown'
-            else:
-                grouped.columns = ['Item Number', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 'D_Std_per_Day']
-                grouped['Current Stock'] = 0
-                grouped['Part Name'] = 'Unknown'
-                grouped['Description 2'] = 'Unknown'
-            
-            # Calculate safety stock (using 95% confidence level, Z = 1.65)
-            Z = 1.65
-            lead_time = 30  # Default lead time in days
-            
-            grouped['Safety Stock'] = Z * np.sqrt(lead_time) * grouped['D_Std_per_Day']
-            grouped['Reorder Point'] = (grouped['D_Mean_per_Day'] * lead_time) + grouped['Safety Stock']
-            grouped['Criticality'] = grouped['D_Mean_per_Day'].apply(self.calculate_criticality)
+            # Group by item number for analysis, naming each output column directly
+            usage_aggs = {
+                'Total Usage': (qty_col, 'sum'),
+                'Usage Count': (qty_col, 'count'),
+                'D_Mean_per_Day': (qty_col, 'mean'),
+                'D_Std_per_Day': (qty_col, 'std'),
+            }
+            optional_cols = [(stock_col, 'Current Stock'), (part_col, 'Part Name'), (desc_col, 'Description 2')]
+            usage_aggs.update((name, (col, 'first')) for col, name in optional_cols if col)
+            grouped = (self.data.groupby(item_col, observed=True).agg(**usage_aggs)
+                       .rename_axis('Item Number').reset_index())
+            
+            # Fill in the optional columns the data lacks
+            for name, default in (('Current Stock', 0), ('Part Name', 'Unknown'), ('Description 2', 'Unknown')):
+                if name not in grouped.columns:
+                    grouped[name] = default
+            
+            # Calculate safety stock (using 95% confidence level, Z = 1.65), reorder point and criticality
+            # in one pass; the mean is already a daily rate, so period_days=1
+            _, safety_stock, reorder_point, criticality = safety_stock_metrics(
+                grouped['D_Mean_per_Day'].to_numpy(dtype=float), grouped['D_Std_per_Day'].to_numpy(dtype=float),
+                period_days=1)
+            grouped['Safety Stock'] = safety_stock
+            grouped['Reorder Point'] = reorder_point
+            grouped['Criticality'] = criticality
             
             self.analysis_results = grouped
             self.display_analysis_results()
@@ -1237,96 +1541,71 @@ class SafetyStockAnalyzer(QMainWindow):
             try:
                 self.create_charts()
             except Exception as e:
-                print(f"Charts disabled due to error: {e}")
+                logger.warning("Charts disabled due to error: %s", e)
                 # Create a simple text message instead
-                self.charts_canvas.figure.clear()
-                ax = self.charts_canvas.figure.add_subplot(111)
+                self._maybe_init_charts(self.charts_tab_index)
+                ax = self.charts_ax
+                ax.clear()
                 ax.text(0.5, 0.5, 'Charts temporarily disabled\nAnalysis completed successfully!', 
                        ha='center', va='center', transform=ax.transAxes, fontsize=12)
                 ax.set_title('Analysis Results Available')
-                self.charts_canvas.draw()
+                self.charts_canvas.draw_idle()
             
             self.export_btn.setEnabled(True)
-            self.status_bar.showMessage("Analysis completed successfully")
+            self.set_status("Analysis completed successfully")
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Analysis failed: {str(e)}")
-            self.status_bar.showMessage("Analysis failed")
+            self.set_status("Analysis failed")
         finally:
             self.progress_bar.setVisible(False)
             
-    def calculate_criticality(self, daily_usage):
-        """Calculate criticality level based on daily usage"""
-        if daily_usage > 10:
-            return "CRITICAL"
-        elif daily_usage > 5:
-            return "HIGH"
-        elif daily_usage > 2:
-            return "MEDIUM"
-        else:
-            return "LOW"
-            
     def display_analysis_results(self):
         """Display analysis results in the safety stock table"""
         if self.analysis_results is None:
             return
             
-        # Set up table
-        self.safety_table.setRowCount(len(self.analysis_results))
-        columns = ['Item Number', 'Part Name', 'Description 2', 'Total Usage', 'Usage Count', 'D_Mean_per_Day', 
-                  'D_Std_per_Day', 'Current Stock', 'Safety Stock', 'Reorder Point', 'Criticality']
-        self.safety_table.setColumnCount(len(columns))
-        self.safety_table.setHorizontalHeaderLabels(columns)
-        
-        # Populate table
-        for i, row in self.analysis_results.iterrows():
-            for j, col in enumerate(columns):
-                value = row[col]
-                if isinstance(value, float):
-                    if col in ['D_Mean_per_Day', 'D_Std_per_Day', 'Safety Stock', 'Reorder Point']:
-                        value = f"{value:.2f}"
-                    else:
-                        value = f"{value:.0f}"
-                item = QTableWidgetItem(str(value))
-                self.safety_table.setItem(i, j, item)
-                
-        # Auto-resize columns
-        self.safety_table.resizeColumnsToContents()
+        columns_changed = self.safety_model.set_frame(self.analysis_results[SAFETY_COLUMNS])
+        
+        # Auto-resize columns when they are first shown; refreshes keep the current widths
+        if columns_changed:
+            self.safety_table.resizeColumnsToContents()
         
     def create_charts(self):
         """Create analysis charts - SIMPLIFIED VERSION"""
-        if self.analysis_results is None:
-            return
+        if self.analysis_results is None or self.charts_canvas is None:
+            return  # Drawn by _maybe_init_charts once the Charts tab is opened
             
         try:
-            # Clear previous charts and create new figure
-            self.charts_canvas.figure.clear()
+            # Clear previous charts, reusing the axes
+            ax = self.charts_ax
+            ax.clear()
             
             # Create a simple success message instead of complex charts
-            ax = self.charts_canvas.figure.add_subplot(111)
+            counts = self.analysis_results['Criticality'].value_counts()  # One pass for all levels
             ax.text(0.5, 0.5, 'Analysis Completed Successfully!\n\n' + 
                    f'Total Items Analyzed: {len(self.analysis_results)}\n' +
-                   f'Critical Items: {len(self.analysis_results[self.analysis_results["Criticality"] == "CRITICAL"])}\n' +
-                   f'High Priority: {len(self.analysis_results[self.analysis_results["Criticality"] == "HIGH"])}\n' +
-                   f'Medium Priority: {len(self.analysis_results[self.analysis_results["Criticality"] == "MEDIUM"])}\n' +
-                   f'Low Priority: {len(self.analysis_results[self.analysis_results["Criticality"] == "LOW"])}', 
+                   f'Critical Items: {counts.get("CRITICAL", 0)}\n' +
+                   f'High Priority: {counts.get("HIGH", 0)}\n' +
+                   f'Medium Priority: {counts.get("MEDIUM", 0)}\n' +
+                   f'Low Priority: {counts.get("LOW", 0)}', 
                    ha='center', va='center', transform=ax.transAxes, fontsize=11)
             ax.set_title('Safety Stock Analysis Results', fontsize=14, fontweight='bold')
             ax.axis('off')  # Hide axes
             
-            # Refresh canvas
-            self.charts_canvas.draw()
+            # Refresh canvas on the next event loop pass
+            self.charts_canvas.draw_idle()
             
         except Exception as e:
-            print(f"Error creating charts: {e}")
+            logger.warning("Error creating charts: %s", e)
             # Create a simple error message chart
-            self.charts_canvas.figure.clear()
-            ax = self.charts_canvas.figure.add_subplot(111)
+            ax = self.charts_ax
+            ax.clear()
             ax.text(0.5, 0.5, 'Charts temporarily disabled\nAnalysis completed successfully!', 
                    ha='center', va='center', transform=ax.transAxes, fontsize=12)
             ax.set_title('Analysis Results Available')
             ax.axis('off')
-            self.charts_canvas.draw()
+            self.charts_canvas.draw_idle()
         
     def export_results(self):
         """Export analysis results"""
@@ -1344,7 +1623,7 @@ class SafetyStockAnalyzer(QMainWindow):
             
             if file_path:
                 if file_path.endswith('.xlsx'):
-                    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+                    with pd.ExcelWriter(file_path, engine=_xlsx_writer_engine()) as writer:
                         self.analysis_results.to_excel(writer, sheet_name='Safety Stock Analysis', index=False)
                         if self.data is not None:
                             self.data.to_excel(writer, sheet_name='Raw Data', index=False)
@@ -1355,8 +1634,7 @@ class SafetyStockAnalyzer(QMainWindow):
                 else:
                     self.analysis_results.to_csv(file_path, index=False)
                     
-                QMessageBox.information(self, "Success", f"Results exported to:\n{file_path}")
-                self.status_bar.showMessage(f"Results exported to {os.path.basename(file_path)}")
+                self.set_status(f"Results exported to {file_path}")
                 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
@@ -1365,7 +1643,7 @@ class SafetyStockAnalyzer(QMainWindow):
         """Clear all loaded data and results"""
         if self.data is None and self.process_parts is None:
             # No data to clear
-            QMessageBox.information(self, "Info", "No data to clear.")
+            self.set_status("No data to clear")
             return
             
         reply = QMessageBox.question(
@@ -1376,19 +1654,26 @@ class SafetyStockAnalyzer(QMainWindow):
             QMessageBox.StandardButton.No  # Default to No for safety
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+            
+        # Repaint once after every widget has been reset, not once per change
+        self.setUpdatesEnabled(False)
+        try:
             self.data = None
+            self._analysis_cols = {}
+            self._summary_cols = {}
+            self._usage_cache = {}
+            self._data_generation += 1
             self.analysis_results = None
             self.process_parts = None
             self.process_analysis = None
+            self._process_groups = {}
             
             # Clear tables
-            self.data_table.setRowCount(0)
-            self.data_table.setColumnCount(0)
-            self.safety_table.setRowCount(0)
-            self.safety_table.setColumnCount(0)
-            self.process_table.setRowCount(0)
-            self.process_table.setColumnCount(0)
+            self.data_model.set_frame(None)
+            self.safety_model.set_frame(None)
+            self.process_model.set_frame(None)
             
             # Clear process selector
             self.process_selector.clear()
@@ -1397,77 +1682,97 @@ class SafetyStockAnalyzer(QMainWindow):
             
             # Clear summary
             self.summary_text.clear()
+            self._summary_dirty = False
             
             # Clear charts
-            self.charts_canvas.figure.clear()
-            self.charts_canvas.draw()
+            if self.charts_canvas is not None:
+                self.charts_ax.clear()
+                self.charts_ax.axis('off')
+                self.charts_canvas.draw_idle()
             
             # Disable buttons
             self.analyze_btn.setEnabled(False)
             self.export_btn.setEnabled(False)
             
-            # Update status
-            self.status_bar.showMessage("Data cleared successfully")
-            
-            QMessageBox.information(self, "Success", "All data and results have been cleared successfully.")
+            # Update status (no message box, so control returns right away)
+            self.set_status("All data and results cleared")
+        finally:
+            self.setUpdatesEnabled(True)
             
     def closeEvent(self, event):
         """Handle application close event with safety confirmation"""
-        if self.data is not None or self.process_parts is not None:
-            # Check if there's data that might be lost
-            reply = QMessageBox.question(
-                self,
-                "⚠️ Exit Confirmation",
-                "You have unsaved data and analysis results.\n\nAre you sure you want to exit?\n\nClick 'Yes' to exit or 'No' to stay.",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No  # Default to No for safety
-            )
+        if (self.data is not None or self.process_parts is not None) and not self._close_confirmed:
+            # Data might be lost: ask from the event loop once pending paints are done,
+            # rather than in a nested dialog loop inside closeEvent
+            event.ignore()
+            if not self._close_pending:
+                self._close_pending = True
+                QTimer.singleShot(0, self._confirm_close)
+            return
             
-            if reply == QMessageBox.StandardButton.Yes:
-                event.accept()
-            else:
-                event.ignore()
-        else:
-            # No data loaded, safe to exit
-            event.accept()
-    
-    def show_about(self):
-        """Show about dialog"""
-        QMessageBox.about(
+        # No data loaded (or exit confirmed), safe to exit
+        if self._process_worker is not None:
+            self._process_worker.wait()  # Don't destroy a running loader thread
+        event.accept()
+        
+    def _confirm_close(self):
+        """Ask whether to exit with data loaded, and close the window on Yes"""
+        reply = QMessageBox.question(
             self,
-            "About Safety Stock Analyzer",
-            """
-            <h3>Safety Stock Analyzer - Professional Edition</h3>
-            <p>A powerful tool for analyzing spare parts usage and calculating safety stock levels.</p>
-            <p><b>Features:</b></p>
-            <ul>
-                <li>📁 Drag & Drop file loading</li>
-                <li>📊 Real-time data display</li>
-                <li>🔍 Advanced safety stock analysis</li>
-                <li>📈 Professional charts and visualizations</li>
-                <li>📤 Export results to Excel/CSV</li>
-            </ul>
-            <p><b>Version:</b> 1.0 Professional</p>
-            <p><b>Built with:</b> Python + PyQt6</p>
-            """
+            "⚠️ Exit Confirmation",
+            "You have unsaved data and analysis results.\n\nAre you sure you want to exit?\n\nClick 'Yes' to exit or 'No' to stay.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No  # Default to No for safety
         )
+        self._close_pending = False
+        if reply == QMessageBox.StandardButton.Yes:
+            self._close_confirmed = True
+            self.close()
+    
+    def show_about(self):
+        """Show about dialog, built on first use and reused afterwards"""
+        if self._about_dialog is None:
+            self._about_dialog = QMessageBox(self)
+            self._about_dialog.setWindowTitle("About Safety Stock Analyzer")
+            self._about_dialog.setTextFormat(Qt.TextFormat.RichText)
+            self._about_dialog.setText(ABOUT_HTML)
+        self._about_dialog.exec()
+
+def _finish_pandas_import():
+    """Execute the lazily imported pandas module
+    
+    The import statement is the one PyInstaller's scan finds, so frozen builds bundle pandas.
+    """
+    import pandas
+    pandas.DataFrame  # First attribute access runs the deferred import
+
+
+@lru_cache(maxsize=None)
+def app_icon():
+    """The application icon, decoded once; None if icon.ico is not installed"""
+    return QIcon(str(ICON_PATH)) if ICON_PATH.is_file() else None
+
 
 def main():
     """Main application entry point"""
+    # Must be set before the QApplication exists: GL-backed widgets then share one context
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
     app = QApplication(sys.argv)
     app.setApplicationName("Safety Stock Analyzer")
     app.setApplicationVersion("1.0")
     
     # Set application icon (if available)
-    try:
-        app.setWindowIcon(QIcon("icon.ico"))
-    except:
-        pass
+    icon = app_icon()
+    if icon is not None:
+        app.setWindowIcon(icon)
     
     # Create and show main window
     window = SafetyStockAnalyzer()
     window.show()
     
+    # Finish importing pandas on the GUI thread right after the first paint, before any file is loaded
+    QTimer.singleShot(0, _finish_pandas_import)
+    
     # Start event loop
     sys.exit(app.exec())
 
@@ -1,5 +1,7 @@
 from setuptools import setup, find_packages
 
+import fastentrypoints  # noqa: F401  Direct-import launchers instead of pkg_resources ones
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -16,6 +18,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/safety-stock-analyzer",
     packages=find_packages(),
+    py_modules=["safety_stock_analyzer"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Manufacturing",
@@ -24,14 +27,7 @@ setup(
         "Topic :: Scientific/Engineering :: Information Analysis",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
         "Operating System :: OS Independent",
-        "Operating System :: Microsoft :: Windows",
-        "Operating System :: POSIX :: Linux",
-        "Operating System :: MacOS",
     ],
     python_requires=">=3.8",
     install_requires=requirements,
@@ -44,21 +40,13 @@ setup(
         ],
         "build": [
             "pyinstaller>=4.0",
-            "cx_Freeze>=6.0",
         ],
     },
     entry_points={
-        "console_scripts": [
-            "safety-stock-analyzer=safety_stock_analyzer:main",
-        ],
         "gui_scripts": [
-            "safety-stock-analyzer-gui=safety_stock_analyzer:main",
+            "safety-stock-analyzer=safety_stock_analyzer:main",
         ],
     },
-    include_package_data=True,
-    package_data={
-        "": ["*.txt", "*.md", "*.bat", "*.yml"],
-    },
     keywords="safety stock, inventory management, spare parts, manufacturing, analysis, desktop application, PyQt6",
     project_urls={
         "Bug Reports": "https://github.com/yourusername/safety-stock-analyzer/issues",